@@ -1,66 +1,663 @@
 #!/usr/bin/env python3
 
-import csv
 import argparse
+import functools
+import math
+import sys
+from dataclasses import dataclass
+
+import numpy as np
+
+# Month indices 1..12, shared by every yearly step
+_MONTHS = np.arange(1, 13)
+
+@functools.lru_cache(maxsize=64)
+def _monthly_rate(annual_return):
+    # Effective monthly rate so that twelve months compound to annual_return.
+    # expm1(log1p(r) / 12) takes a cheaper libm path than a general pow and
+    # keeps full precision for small rates, where (1 + r) ** (1 / 12) - 1
+    # loses low bits twice. The same handful of return values recurs across
+    # sweeps, so cache it too.
+    return math.expm1(math.log1p(annual_return) / 12)
+
+@functools.lru_cache(maxsize=64)
+def _growth_powers(monthly_rate):
+    # Within-year growth factors g^1..g^12 for this rate; read-only so the
+    # cached array cannot be corrupted by callers
+    powers = np.power(1 + monthly_rate, _MONTHS)
+    powers.setflags(write=False)
+    return powers
+
+def _simulate_closed_form(principal, monthly_rate, monthly_expense, annual_return_pct, charity_rate, record,
+                          _argmax=np.argmax, _float=float):
+    # _argmax/_float are pre-bound as defaults: this kernel is the interpreted
+    # fallback when numba is absent, where per-iteration global and attribute
+    # lookups in the year loop are measurable.
+    out = np.empty((30, 7))
+    # The monthly recurrence P <- P * (1 + r) - E has the closed form
+    # P_n = P_0 * g^n - E * (g^n - 1) / r with g = 1 + r, so a whole year
+    # can be evaluated as one vector expression instead of 12 loop steps.
+    growth = 1 + monthly_rate
+    powers = _growth_powers(monthly_rate)
+
+    # With the yearly charity folded in, year-end principals follow the
+    # linear recurrence P <- P * k - E * annuity with k = g^12 - charity,
+    # which also has a closed form. Evaluate all 30 year ends in one shot
+    # and only fall back to the year loop when the principal runs out
+    # somewhere (start and end of each year positive implies every month is,
+    # since the within-year series is monotonic).
+    year_growth = float(powers[-1])
+    annuity = (year_growth - 1) / monthly_rate if monthly_rate != 0 else 12.0
+    k = year_growth - charity_rate
+    years = np.arange(1, 31)
+    if k != 1:
+        k_pow = np.power(k, years)
+        year_ends = principal * k_pow - monthly_expense * annuity * (k_pow - 1) / (k - 1)
+    else:
+        year_ends = principal - monthly_expense * annuity * years
+
+    if principal > 0 and (year_ends > 0).all():
+        year_starts = np.empty(30)
+        year_starts[0] = principal
+        year_starts[1:] = year_ends[:-1]
+        years_recorded = 0
+        if record:
+            charity = year_starts * charity_rate
+            out[:, 0] = years
+            out[:, 1] = year_starts
+            out[:, 2] = annual_return_pct
+            out[:, 3] = year_ends + charity - year_starts + 12 * monthly_expense
+            out[:, 4] = charity
+            out[:, 5] = 12 * monthly_expense
+            out[:, 6] = year_ends
+            years_recorded = 30
+        final = float(year_ends[-1])
+        return 360, final, final > float(year_starts[-1]), years_recorded, out
 
-def calculate_lifeline(principal, annual_return, monthly_expense, output_csv=False, print_console=True):
     months = 0
-    monthly_return_rate = annual_return / 12
-    charity_rate = 0.025
-    remaining_principal = principal
+    remaining = principal
+    year = 1
+    years_recorded = 0
+    indefinite = False
+    # The expense term of the closed form does not depend on the year's
+    # starting principal, so it is hoisted out of the loop. powers is all
+    # ones at zero rate, which folds that case into the same expression.
+    if monthly_rate != 0:
+        expense_terms = monthly_expense * (powers - 1) / monthly_rate
+    else:
+        expense_terms = monthly_expense * _MONTHS
+    while remaining > 0 and year <= 30:
+        starting = remaining
+        end_months = starting * powers - expense_terms
+
+        # The series is monotonic within a year, so the first non-positive
+        # entry marks the month the principal ran out.
+        depleted = end_months <= 0
+        if depleted.any():
+            months_run = int(_argmax(depleted)) + 1
+            # Only what is left can be spent in the final month
+            previous = _float(end_months[months_run - 2]) if months_run > 1 else starting
+            total_expense = (months_run - 1) * monthly_expense + previous * growth
+            remaining = 0.0
+        else:
+            months_run = 12
+            remaining = _float(end_months[11])
+            total_expense = 12 * monthly_expense
+        total_interest = remaining - starting + total_expense
+        months += months_run
 
-    # List to store yearly data if CSV or console output is required
-    yearly_data = []
+        # A depleted principal owes no charity; the boolean factor keeps the
+        # guard branchless
+        charity_amount = starting * charity_rate * (remaining > 0.0)
+        remaining -= charity_amount
 
+        if record:
+            out[years_recorded, 0] = year
+            out[years_recorded, 1] = starting
+            out[years_recorded, 2] = annual_return_pct
+            out[years_recorded, 3] = total_interest
+            out[years_recorded, 4] = charity_amount
+            out[years_recorded, 5] = total_expense
+            out[years_recorded, 6] = remaining
+            years_recorded += 1
+
+        if remaining > starting and year == 30:
+            indefinite = True
+            break
+
+        year += 1
+
+    return months, remaining, indefinite, years_recorded, out
+
+def _simulate_loop(principal, monthly_rate, monthly_expense, annual_return_pct, charity_rate, record):
+    # Scalar form of _simulate_closed_form. Written with only scalar locals
+    # so that Numba can compile it; see _load_simulate. Years are stepped with
+    # the annuity closed form P <- P * g^12 - E * (g^12 - 1) / r, and the
+    # month loop only runs for the year the principal runs out, where the
+    # depletion month and the partial final spend have to be located. The
+    # within-year series is monotonic, so a positive year end means every
+    # month was positive.
+    out = np.empty((30, 7))
+    months = 0
+    remaining = principal
+    growth = 1.0 + monthly_rate
+    year_growth = growth ** 12
+    annuity = (year_growth - 1.0) / monthly_rate if monthly_rate != 0 else 12.0
     year = 1
-    indefinite_growth = False
-    while remaining_principal > 0 and year <= 30:
-        starting_principal = remaining_principal
-        total_interest = 0
-        total_expense = 0
-
-        for _ in range(12):
-            if remaining_principal <= 0:
-                break
-            interest_earned = remaining_principal * monthly_return_rate
-            remaining_principal += interest_earned - monthly_expense
-            total_interest += interest_earned
-            total_expense += monthly_expense
-            months += 1
-
-        charity_amount = starting_principal * charity_rate
-        remaining_principal -= charity_amount
-
-        if output_csv or print_console:
-            yearly_data.append([
-                year, round(starting_principal, 2), round(annual_return * 100, 2), round(total_interest, 2),
-                round(charity_amount, 2), round(total_expense, 2), round(remaining_principal, 2)
-            ])
-
-        if remaining_principal > starting_principal and year == 30:
-            indefinite_growth = True
+    years_recorded = 0
+    indefinite = False
+    while remaining > 0 and year <= 30:
+        starting = remaining
+        year_end = starting * year_growth - monthly_expense * annuity
+
+        if year_end > 0.0:
+            total_expense = 12.0 * monthly_expense
+            total_interest = year_end - starting + total_expense
+            remaining = year_end
+            months += 12
+        else:
+            total_interest = 0.0
+            total_expense = 0.0
+            for _ in range(12):
+                if remaining <= 0:
+                    break
+                # Fused update: grow, then spend no more than what is there.
+                # min/max keep this branchless so LLVM can lower it to
+                # minsd/maxsd when the kernel is compiled by Numba.
+                new_principal = remaining * growth
+                actual_expense = max(0.0, min(monthly_expense, new_principal))
+                total_interest += new_principal - remaining
+                total_expense += actual_expense
+                remaining = new_principal - actual_expense
+                months += 1
+
+        # A depleted principal owes no charity; multiplying by the comparison
+        # keeps this branchless too
+        charity_amount = starting * charity_rate * (remaining > 0.0)
+        remaining -= charity_amount
+
+        if record:
+            out[years_recorded, 0] = year
+            out[years_recorded, 1] = starting
+            out[years_recorded, 2] = annual_return_pct
+            out[years_recorded, 3] = total_interest
+            out[years_recorded, 4] = charity_amount
+            out[years_recorded, 5] = total_expense
+            out[years_recorded, 6] = remaining
+            years_recorded += 1
+
+        if remaining > starting and year == 30:
+            indefinite = True
             break
 
         year += 1
 
-    if output_csv:
-        with open('yearly_output.csv', 'w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(['Year', 'Starting Principal', 'Annual Return %', 'Annual Returns Amount', 'Charity Amount', 'Annual Expense', 'Ending Year Principal'])
-            writer.writerows(yearly_data)
-        print("Yearly output saved to 'yearly_output.csv'.")
+    return months, remaining, indefinite, years_recorded, out
+
+_simulate = None
+
+def _load_simulate():
+    # Resolve the simulation kernel on first use: the Numba-compiled scalar
+    # loop when numba is available, the closed-form NumPy version otherwise.
+    # The import is deferred so CLI startup does not pay for it.
+    global _simulate
+    if _simulate is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _simulate = _simulate_closed_form
+        else:
+            _simulate = njit(cache=True)(_simulate_loop)
+    return _simulate
+
+def _simulate_scenario(principal, annual_return, monthly_expense, months_out, final_out, indefinite_out):
+    # Per-scenario core of the batched kernel: the same annualized recurrence
+    # as _simulate_loop, minus row recording, which the batch API does not
+    # expose. The one-element output views are guvectorize's convention for
+    # scalar core dimensions.
+    monthly_rate = math.expm1(math.log1p(annual_return) / 12.0)
+    growth = 1.0 + monthly_rate
+    year_growth = growth ** 12
+    annuity = (year_growth - 1.0) / monthly_rate if monthly_rate != 0 else 12.0
+    charity_rate = 0.025
+    months = 0
+    remaining = principal
+    indefinite = False
+    year = 1
+    while remaining > 0 and year <= 30:
+        starting = remaining
+        year_end = starting * year_growth - monthly_expense * annuity
+        if year_end > 0.0:
+            remaining = year_end
+            months += 12
+        else:
+            for _ in range(12):
+                if remaining <= 0:
+                    break
+                new_principal = remaining * growth
+                actual_expense = max(0.0, min(monthly_expense, new_principal))
+                remaining = new_principal - actual_expense
+                months += 1
+        remaining -= starting * charity_rate * (remaining > 0.0)
+        if remaining > starting and year == 30:
+            indefinite = True
+            break
+        year += 1
+    months_out[0] = months
+    final_out[0] = remaining
+    indefinite_out[0] = indefinite
+
+_batch_kernel = None
+_batch_kernel_resolved = False
+
+def _load_batch_kernel():
+    # Resolve the batched kernel on first use, like _load_simulate: a Numba
+    # gufunc over scenarios when numba is available, None otherwise (the
+    # caller then falls back to the broadcasted NumPy path).
+    global _batch_kernel, _batch_kernel_resolved
+    if not _batch_kernel_resolved:
+        _batch_kernel_resolved = True
+        try:
+            from numba import guvectorize
+        except ImportError:
+            _batch_kernel = None
+        else:
+            _batch_kernel = guvectorize(
+                ['void(float64, float64, float64, int64[:], float64[:], boolean[:])'],
+                '(),(),()->(),(),()', nopython=True, cache=True,
+            )(_simulate_scenario)
+    return _batch_kernel
+
+def warm_up():
+    """Compile (or cache-load) the simulation kernel ahead of real use.
+
+    The first call into the Numba kernel pays a one-time compile, or a cache
+    load on later runs thanks to cache=True. Calling this during startup or
+    test setup moves that cost out of the first measured calculation; it is a
+    no-op when numba is not installed.
+    """
+    _load_simulate()(1.0, _monthly_rate(0.05), 1.0, 5.0, 0.025, True)
+
+# Whether to emit escape codes is decided once here; _c turns each code into
+# an empty string on non-TTY output instead of rewriting every Colors
+# attribute after the fact
+_TTY = sys.stdout.isatty()
+
+def _c(code):
+    return code if _TTY else ''
+
+class Colors:
+    RESET = _c('\033[0m')
+    BOLD = _c('\033[1m')
+    RED = _c('\033[31m')
+    GREEN = _c('\033[32m')
+    YELLOW = _c('\033[33m')
+    MAGENTA = _c('\033[35m')
+    CYAN = _c('\033[36m')
+    BRIGHT_RED = _c('\033[91m')
+    BRIGHT_GREEN = _c('\033[92m')
+    BRIGHT_YELLOW = _c('\033[93m')
+
+# Precomputed color wrappers: wrapping a cell is one .format call instead of
+# concatenating the escape codes around it every time
+_WRAP = {
+    'green': f"{Colors.GREEN}{{}}{Colors.RESET}",
+    'red': f"{Colors.RED}{{}}{Colors.RESET}",
+    'yellow': f"{Colors.YELLOW}{{}}{Colors.RESET}",
+    'magenta': f"{Colors.MAGENTA}{{}}{Colors.RESET}",
+    'cyan': f"{Colors.CYAN}{{}}{Colors.RESET}",
+    'bright_green': f"{Colors.BRIGHT_GREEN}{{}}{Colors.RESET}",
+    'bright_red': f"{Colors.BRIGHT_RED}{{}}{Colors.RESET}",
+    'bright_yellow': f"{Colors.BRIGHT_YELLOW}{{}}{Colors.RESET}",
+}
+
+# The table layout is static, so its borders and header are built once at
+# import with single joins rather than per call with repeated concatenation
+_TABLE_COLS = [('Year', 6), ('Starting', 14), ('Returns', 12), ('Charity', 12), ('Expenses', 12), ('Ending', 14), ('Change', 13)]
+_TABLE_TOP = '┌' + '┬'.join('─' * width for _, width in _TABLE_COLS) + '┐'
+_TABLE_SEP = '├' + '┼'.join('─' * width for _, width in _TABLE_COLS) + '┤'
+_TABLE_BOTTOM = '└' + '┴'.join('─' * width for _, width in _TABLE_COLS) + '┘'
+_TABLE_HEADER = '│' + '│'.join(f"{Colors.BOLD}{name:^{width}}{Colors.RESET}" for name, width in _TABLE_COLS) + '│'
+
+# Table row template with all static color codes and separators baked in, so
+# emitting a row is one .format call instead of a chain of concatenations
+_TABLE_ROW_FMT = (
+    '│ {indicator}{year:>3} '
+    '│ {starting:>12} '
+    f"│ {Colors.GREEN}{{returns:>10}}{Colors.RESET} "
+    f"│ {Colors.MAGENTA}{{charity:>10}}{Colors.RESET} "
+    f"│ {Colors.YELLOW}{{expense:>10}}{Colors.RESET} "
+    '│ {ending} '
+    '│ {change} │'
+)
+
+# Precompiled templates for the legacy console table; format(*row) reuses one
+# compiled format string instead of evaluating seven f-string slots per row
+_LEGACY_ROW_FMT = "{:<5.0f} {:<20.2f} {:<15.2f} {:<20.2f} {:<15.2f} {:<15.2f} {:<20.2f}"
+_LEGACY_HEADER = "{:<5} {:<20} {:<15} {:<20} {:<15} {:<15} {:<20}".format(
+    'Year', 'Starting Principal', 'Annual Return %', 'Annual Returns Amount',
+    'Charity Amount', 'Annual Expense', 'Ending Year Principal'
+)
+
+# Bound once so each call reuses one compiled format string; rounding to int
+# first keeps the grouping on the fast integer path instead of float dtoa
+_CUR_INT = "${:,}".format
+
+@functools.lru_cache(maxsize=4096)
+def fmt_currency(value):
+    return _CUR_INT(round(value))
+
+def fmt_change(value, width=11):
+    text = ('+' if value >= 0 else '-') + fmt_currency(abs(value))
+    wrap = _WRAP['bright_green'] if value >= 0 else _WRAP['bright_red']
+    return wrap.format(f"{text:>{width}}")
+
+def colorize_principal(value, width=12):
+    wrap = _WRAP['green'] if value > 0 else _WRAP['red']
+    return wrap.format(f"{fmt_currency(value):>{width}}")
+
+def render_dashboard(principal, annual_return, monthly_expense, result):
+    lines = []
+    lines.append(f"{Colors.BOLD}Lifeline{Colors.RESET}")
+    lines.append(
+        f"  Principal: {_WRAP['cyan'].format(fmt_currency(principal))}"
+        f"   Annual return: {_WRAP['cyan'].format(f'{annual_return:.1%}')}"
+        f"   Monthly expense: {_WRAP['cyan'].format(fmt_currency(monthly_expense))}"
+    )
+    if result['indefinite_growth']:
+        lines.append(
+            f"  {_WRAP['bright_green'].format('Grows indefinitely')}"
+            f" - principal at 30 years is approximately {fmt_currency(result['final_principal'])}"
+        )
+    else:
+        runway = f"{result['years']}y {result['remaining_months']}m"
+        lines.append(f"  Runway: {_WRAP['bright_yellow'].format(runway)}")
+    return "\n".join(lines)
+
+def render_ascii_chart(principals, height=12):
+    principals = np.maximum(np.asarray(principals, dtype=float), 0.0)
+    if principals.size == 0:
+        return ""
+    min_val = 0.0
+    val_range = float(principals.max() - min_val) or 1.0
+
+    # One vectorized pass instead of recomputing the bar height of every
+    # column once per chart row
+    bar_heights = ((principals - min_val) / val_range * height).astype(int)
+    declining = np.r_[False, np.diff(principals) < 0]
+    blocks = np.where(declining, _WRAP['red'].format('█'), _WRAP['green'].format('█'))
+
+    # The whole chart body is one 2-D mask assignment; the row loop only
+    # prepends the axis label and joins the prebuilt cells
+    row_levels = np.arange(height, -1, -1)
+    grid = np.where(bar_heights[None, :] >= row_levels[:, None], blocks[None, :], ' ')
+
+    lines = [f"{Colors.BOLD}Principal by year{Colors.RESET}"]
+    for i, row in enumerate(row_levels):
+        label = fmt_currency(min_val + val_range * row / height)
+        lines.append(f"{label:>10} " + ''.join(grid[i]))
+
+    lines.append(' ' * 11 + ''.join(str((i + 1) % 10) for i in range(principals.size)))
+    return "\n".join(lines)
+
+def render_pretty_table(yearly_data):
+    rows = []
+    for row in yearly_data:
+        year, starting, _, returns, charity, expense, ending = row
+        change = ending - starting
+        indicator = _WRAP['bright_green'].format('▲') if change >= 0 else _WRAP['bright_red'].format('▼')
+        rows.append(_TABLE_ROW_FMT.format(
+            indicator=indicator, year=int(year), starting=fmt_currency(starting),
+            returns=fmt_currency(returns), charity=fmt_currency(charity),
+            expense=fmt_currency(expense), ending=colorize_principal(ending),
+            change=fmt_change(change),
+        ))
+
+    return "\n".join([_TABLE_TOP, _TABLE_HEADER, _TABLE_SEP, *rows, _TABLE_BOTTOM])
+
+@dataclass(frozen=True, slots=True)
+class LifelineResult:
+    """What calculate_lifeline returns. Frozen and slotted: attribute reads
+    skip the instance dict and results are safe to share between callers.
+    Subscripting is kept for code written against the old dict result.
+    yearly_data is a read-only (years, 7) float64 array; its rows index and
+    unpack the same way the old per-year lists did."""
+    indefinite_growth: bool
+    final_principal: float
+    months: int
+    years: int
+    remaining_months: int
+    yearly_data: np.ndarray
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+# Shared empty row block for results that carry no yearly data
+_NO_ROWS = np.empty((0, 7))
+_NO_ROWS.flags.writeable = False
+
+@functools.lru_cache(maxsize=1024)
+def _compute(principal, annual_return, monthly_expense, record):
+    # Pure numeric core of calculate_lifeline, memoized since repeated runs
+    # of identical scenarios are common in sweeps and notebooks. The frozen
+    # result with tuple rows is built here so repeated calls share one
+    # immutable object instead of rebuilding it per call.
+    monthly_return_rate = _monthly_rate(annual_return)
+    charity_rate = 0.025
+
+    # Fast path for summary-only calls: if a year's growth net of charity
+    # always covers the year's expenses the principal can never shrink, so
+    # the 30-year outcome follows from the yearly recurrence
+    # P <- P * (1 + net) - E * annuity in closed form, with no simulation.
+    net = annual_return - charity_rate
+    if not record and net > 0:
+        annuity = annual_return / monthly_return_rate if monthly_return_rate != 0 else 12.0
+        if monthly_expense * annuity < principal * net:
+            yearly_expense = monthly_expense * annuity
+            final_principal = principal * (1 + net) ** 30 - yearly_expense * ((1 + net) ** 30 - 1) / net
+            return LifelineResult(True, final_principal, 360, 30, 0, _NO_ROWS)
+
+    simulate = _load_simulate()
+    months, final_principal, indefinite, years_recorded, out = simulate(
+        principal, monthly_return_rate, monthly_expense,
+        round(annual_return * 100, 2), charity_rate, record
+    )
+    yearly_data = out[:years_recorded].copy()
+    yearly_data.flags.writeable = False
+    return LifelineResult(indefinite, final_principal, months, months // 12, months % 12, yearly_data)
+
+_CSV_HEADER = 'Year,Starting Principal,Annual Return %,Annual Returns Amount,Charity Amount,Annual Expense,Ending Year Principal\r\n'
+
+def _csv_row(row):
+    return f"{row[0]:.0f},{row[1]:.2f},{row[2]:.2f},{row[3]:.2f},{row[4]:.2f},{row[5]:.2f},{row[6]:.2f}\r\n"
+
+def calculate_lifeline(principal, annual_return, monthly_expense, output_csv=False, print_console=True, pretty=False, row_sink=None):
+    needs_rows = print_console or pretty
+
+    if not needs_rows and (output_csv or row_sink is not None):
+        # Streaming path: yearly rows are pushed into the sinks straight from
+        # the kernel's output buffer and yearly_data is never materialized.
+        # The memoized _compute is bypassed since delivering rows is a side
+        # effect that must happen on every call.
+        simulate = _load_simulate()
+        months, remaining_principal, indefinite_growth, years_recorded, out = simulate(
+            principal, _monthly_rate(annual_return), monthly_expense,
+            round(annual_return * 100, 2), 0.025, True
+        )
+
+        sinks = []
+        file = None
+        if output_csv:
+            file = open('yearly_output.csv', 'w', buffering=1 << 20, newline='')
+            file.write(_CSV_HEADER)
+            sinks.append(lambda row: file.write(_csv_row(row)))
+        if row_sink is not None:
+            sinks.append(row_sink)
+        for i in range(years_recorded):
+            row = (int(out[i, 0]), *out[i, 1:].tolist())
+            for sink in sinks:
+                sink(row)
+        if file is not None:
+            file.close()
+            print("Yearly output saved to 'yearly_output.csv'.")
+
+        result = LifelineResult(indefinite_growth, remaining_principal, months,
+                                months // 12, months % 12, ())
+    else:
+        # The memoized core returns the finished frozen result, so repeated
+        # calls with the same inputs share one object end to end
+        result = _compute(principal, annual_return, monthly_expense, needs_rows)
+
+        # Yearly data for CSV or console output; values stay unrounded here
+        # and are rounded only where they are emitted
+        yearly_data = result.yearly_data
+        if row_sink is not None:
+            for row in yearly_data:
+                row_sink(row)
+
+        if output_csv:
+            # The rows are fixed seven-column numerics with nothing to quote
+            # or escape, so csv.writer buys nothing over direct writes
+            with open('yearly_output.csv', 'w', buffering=1 << 20, newline='') as file:
+                file.write(_CSV_HEADER)
+                file.writelines(_csv_row(row) for row in yearly_data)
+            print("Yearly output saved to 'yearly_output.csv'.")
 
     if print_console:
-        print(f"{'Year':<5} {'Starting Principal':<20} {'Annual Return %':<15} {'Annual Returns Amount':<20} {'Charity Amount':<15} {'Annual Expense':<15} {'Ending Year Principal':<20}")
-        for row in yearly_data:
-            print(f"{row[0]:<5} {row[1]:<20} {row[2]:<15} {row[3]:<20} {row[4]:<15} {row[5]:<15} {row[6]:<20}")
+        # One write call for the whole table instead of one print per row
+        lines = [_LEGACY_HEADER]
+        lines.extend(_LEGACY_ROW_FMT.format(*row) for row in result.yearly_data)
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    if pretty:
+        sys.stdout.write("\n".join([
+            render_dashboard(principal, annual_return, monthly_expense, result),
+            render_ascii_chart(result.yearly_data[:, 6]),
+            render_pretty_table(result.yearly_data),
+            "",
+        ]))
 
-    if indefinite_growth:
-        print(f"\nThe principal will grow indefinitely. Principal at 30 years will be approximately {remaining_principal:.2f}.")
+    if result.indefinite_growth:
+        print(f"\nThe principal will grow indefinitely. Principal at 30 years will be approximately {result.final_principal:.2f}.")
     else:
-        years = months // 12
-        remaining_months = months % 12
-        print(f"\nYour savings will last for approximately {years} years and {remaining_months} months.")
+        print(f"\nYour savings will last for approximately {result.years} years and {result.remaining_months} months.")
+
+    return result
+
+@functools.lru_cache(maxsize=1024)
+def calculate_sustainable_expense(principal, annual_return, charity_rate=0.025):
+    """Largest monthly expense the principal can sustain forever.
+
+    At break-even the year's growth net of charity exactly pays the year's
+    expenses, so the answer is the direct formula principal * (return -
+    charity) / 12 - no simulation needed. Treats returns and expenses as
+    annual aggregates; the inverse of calculate_required_return.
+    """
+    if annual_return <= charity_rate:
+        return 0.0
+    return principal * (annual_return - charity_rate) / 12.0
+
+@functools.lru_cache(maxsize=1024)
+def calculate_required_return(principal, monthly_expense, charity_rate=0.025):
+    """Smallest annual return that sustains the given monthly expense.
+
+    Solves the break-even condition of calculate_sustainable_expense for the
+    return rate: expense * 12 / principal + charity. Same annual-aggregate
+    view, so the two functions are exact inverses of each other.
+    """
+    return monthly_expense * 12.0 / principal + charity_rate
+
+def calculate_lifeline_batch(principals, annual_returns, monthly_expenses):
+    """Run many scenarios at once with broadcasted NumPy operations.
+
+    The three inputs are broadcast against each other; for each scenario the
+    same 30-year simulation as calculate_lifeline is evaluated one year at a
+    time across the whole batch. Returns (months, final_principals,
+    indefinite_growth) arrays in the broadcast shape.
+
+    With numba installed the whole sweep runs as one compiled gufunc call;
+    otherwise the year loop below steps all scenarios together with NumPy.
+    """
+    kernel = _load_batch_kernel()
+    if kernel is not None:
+        return kernel(
+            np.asarray(principals, dtype=float),
+            np.asarray(annual_returns, dtype=float),
+            np.asarray(monthly_expenses, dtype=float),
+        )
+
+    principals, annual_returns, monthly_expenses = np.broadcast_arrays(
+        np.asarray(principals, dtype=float),
+        np.asarray(annual_returns, dtype=float),
+        np.asarray(monthly_expenses, dtype=float),
+    )
+    shape = principals.shape
+    expenses = monthly_expenses.ravel()
+
+    monthly_rate = np.expm1(np.log1p(annual_returns.ravel()) / 12)
+    powers = (1 + monthly_rate)[:, None] ** _MONTHS
+    # Avoid dividing by zero for flat-return scenarios; they use the linear form
+    safe_rate = np.where(monthly_rate == 0, 1.0, monthly_rate)
+    charity_rate = 0.025
+
+    months = np.zeros(expenses.shape, dtype=np.int64)
+    remaining = principals.ravel().copy()
+    indefinite = np.zeros(expenses.shape, dtype=bool)
+
+    for year in range(1, 31):
+        alive = remaining > 0
+        if not alive.any():
+            break
+        starting = remaining
+        end_months = np.where(
+            monthly_rate[:, None] == 0,
+            starting[:, None] - expenses[:, None] * _MONTHS,
+            starting[:, None] * powers - expenses[:, None] * (powers - 1) / safe_rate[:, None],
+        )
+        depleted = end_months <= 0
+        months_run = np.where(depleted.any(axis=1), depleted.argmax(axis=1) + 1, 12)
+        year_end = np.take_along_axis(end_months, (months_run - 1)[:, None], axis=1)[:, 0]
+        # Expenses stop once the principal is gone, and a depleted principal
+        # owes no charity, matching the scalar kernels
+        year_end = np.maximum(year_end, 0.0)
+        year_end -= starting * charity_rate * (year_end > 0.0)
+
+        months = np.where(alive, months + months_run, months)
+        remaining = np.where(alive, year_end, remaining)
+        if year == 30:
+            indefinite = alive & (remaining > starting)
+
+    return months.reshape(shape), remaining.reshape(shape), indefinite.reshape(shape)
+
+def run_batch_csv(input_path, output_path='batch_output.csv'):
+    import csv
+    with open(input_path, newline='') as file:
+        reader = csv.DictReader(file)
+        scenarios = [
+            (float(row['principal']), float(row['annual_return']), float(row['monthly_expense']))
+            for row in reader
+        ]
+
+    principals, annual_returns, monthly_expenses = (np.array(column) for column in zip(*scenarios))
+    months, final_principals, indefinite = calculate_lifeline_batch(principals, annual_returns, monthly_expenses)
+
+    # The rows are purely numeric, so skip csv.writer and serialize chunks of
+    # rows into single large write() calls instead of one call per row
+    with open(output_path, 'w', buffering=1 << 20, newline='') as file:
+        file.write('Principal,Annual Return,Monthly Expense,Months,Years,Final Principal,Indefinite Growth\n')
+        chunk_size = 4096
+        for start in range(0, len(scenarios), chunk_size):
+            stop = min(start + chunk_size, len(scenarios))
+            file.write('\n'.join(
+                f"{principals[i]},{annual_returns[i]},{monthly_expenses[i]},"
+                f"{months[i]},{months[i] // 12},{final_principals[i]:.2f},{bool(indefinite[i])}"
+                for i in range(start, stop)
+            ) + '\n')
+    print(f"Batch output for {len(scenarios)} scenarios saved to '{output_path}'.")
+
+def _prompt(label, default, caster=float):
+    value = input(f"{label} [{default}]: ").strip()
+    return caster(value) if value else default
 
 def main():
     parser = argparse.ArgumentParser(description='Calculate how long your savings will last with given parameters.')
@@ -69,20 +666,22 @@ def main():
     parser.add_argument('--monthly_expense', type=float, default=7000, help='Monthly expense (default: 7,000)')
     parser.add_argument('--output_csv', action='store_true', help='Generate a yearly output CSV file')
     parser.add_argument('--print_console', action='store_true', help='Print the yearly output to the console')
+    parser.add_argument('--pretty', action='store_true', help='Print a colorized dashboard, chart and table')
     parser.add_argument('--ui', action='store_true', help='Provide input through the console interactively')
+    parser.add_argument('--batch_csv', type=str, help='Run every scenario in the given CSV file (columns: principal, annual_return, monthly_expense)')
 
     args = parser.parse_args()
 
+    if args.batch_csv:
+        run_batch_csv(args.batch_csv)
+        return
+
     if args.ui:
-        principal = input(f"Enter the principal saving amount (default: {args.principal}): ") or args.principal
-        annual_return = input(f"Enter the annual return rate (as a decimal, e.g., 0.05 for 5%) (default: {args.annual_return}): ") or args.annual_return
-        monthly_expense = input(f"Enter the monthly expense (default: {args.monthly_expense}): ") or args.monthly_expense
-        output_csv = input("Do you want to generate a yearly output CSV file? (yes/no) (default: no): ").strip().lower() == 'yes'
-        print_console = input("Do you want to print the yearly output to the console? (yes/no) (default: no): ").strip().lower() == 'yes'
-
-        principal = float(principal)
-        annual_return = float(annual_return)
-        monthly_expense = float(monthly_expense)
+        principal = _prompt('Principal saving amount', args.principal)
+        annual_return = _prompt('Annual return rate (as a decimal, e.g., 0.05 for 5%)', args.annual_return)
+        monthly_expense = _prompt('Monthly expense', args.monthly_expense)
+        output_csv = _prompt('Generate a yearly output CSV file? (yes/no)', 'no', str).lower() == 'yes'
+        print_console = _prompt('Print the yearly output to the console? (yes/no)', 'no', str).lower() == 'yes'
     else:
         principal = args.principal
         annual_return = args.annual_return
@@ -95,7 +694,8 @@ def main():
         annual_return,
         monthly_expense,
         output_csv,
-        print_console
+        print_console,
+        args.pretty
     )
 
 if __name__ == "__main__":